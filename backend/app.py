@@ -1,14 +1,21 @@
 import os
 import uuid
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 # Custom Modules
+# Heavy SDKs (google-genai, groq, edge-tts, pdfplumber) are imported lazily
+# inside these modules so the health check can respond on cold start.
+from core import pdf_reader, processor
 from core.pdf_reader import extract_text_from_pdf
 from core.processor import answer_from_notice
-from audio import transcribe_audio, text_to_speech 
+import audio
+from audio import transcribe_audio, text_to_speech
 
 # Configure Logging with detailed formatting
 logging.basicConfig(
@@ -17,10 +24,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Set SETU_WARMUP_ON_STARTUP=0 to skip the background warm-up (e.g. in tests)
+WARMUP_ON_STARTUP = os.environ.get("SETU_WARMUP_ON_STARTUP", "1") != "0"
+
+# Warm-up state, reported by /warmup
+warmup_status = {"state": "pending", "seconds": None, "errors": {}}
+
+
+def warm_up_dependencies() -> dict:
+    """
+    Import heavy dependencies and create API clients ahead of the first request.
+
+    Runs in a worker thread. Failures (e.g. missing API keys) are logged and
+    recorded, never raised, so the server keeps serving.
+    """
+    warmup_status["state"] = "running"
+    started = time.perf_counter()
+    errors = {}
+
+    for name, warm in (
+        ("pdf_reader", pdf_reader.warm_up),
+        ("processor", processor.warm_up),
+        ("audio", audio.warm_up),
+    ):
+        try:
+            warm()
+            logger.info(f"[WARMUP] {name} ready")
+        except Exception as e:
+            errors[name] = str(e)
+            logger.warning(f"[WARMUP] {name} failed: {str(e)}")
+
+    warmup_status["seconds"] = round(time.perf_counter() - started, 3)
+    warmup_status["errors"] = errors
+    warmup_status["state"] = "done"
+    logger.info(f"[WARMUP] Completed in {warmup_status['seconds']}s")
+    return warmup_status
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so the health check is not blocked
+    if WARMUP_ON_STARTUP:
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up_dependencies))
+        logger.info("[INIT] Background warm-up scheduled")
+    yield
+
+
 app = FastAPI(
     title="Setu Backend",
     description="Voice-to-Voice PWA for school information queries",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 1. Mount Static Folder (CRITICAL for serving audio files to frontend)
@@ -58,6 +112,23 @@ def health_check():
     }
 
 
+@app.post("/warmup")
+async def warmup_handler():
+    """
+    Load heavy dependencies now instead of on the first chat request.
+
+    Safe to call repeatedly; already-loaded modules and clients are reused.
+    """
+    logger.info("[WARMUP] Warm-up requested")
+    return await asyncio.to_thread(warm_up_dependencies)
+
+
+@app.get("/warmup")
+def warmup_status_handler():
+    """Report the state of the background warm-up."""
+    return warmup_status
+
+
 @app.post("/api/chat")
 async def chat_handler(
     audio_file: UploadFile = File(None),
@@ -4,16 +4,18 @@ Audio processing module for SETU backend.
 Handles:
 - Cloud-based Speech-to-Text (STT) using Groq (Whisper-large-v3-turbo)
 - Text-to-Speech (TTS) using Edge-TTS
+
+`groq` and `edge_tts` are imported on first use so that importing this
+module (and therefore `app.py`) stays cheap on container cold start.
 """
 
 import logging
 import os
 import uuid
 import asyncio
-import edge_tts
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from groq import Groq
 from dotenv import load_dotenv
 
 # Load environment variables (GROQ_API_KEY)
@@ -23,9 +25,24 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-# Initialize Groq Client
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
-client = Groq(api_key=GROQ_API_KEY)
+
+
+@lru_cache(maxsize=1)
+def get_groq_client():
+    """Create the Groq client on first use and reuse it afterwards."""
+    from groq import Groq
+
+    logger.info("[AUDIO] Initializing Groq client")
+    return Groq(api_key=GROQ_API_KEY)
+
+
+def warm_up() -> None:
+    """Import the STT/TTS libraries and build the Groq client ahead of the first request."""
+    import edge_tts  # noqa: F401
+
+    if GROQ_API_KEY:
+        get_groq_client()
 
 async def transcribe_audio(audio_file_path: str, language: Optional[str] = None) -> str:
     """
@@ -59,6 +76,7 @@ async def transcribe_audio(audio_file_path: str, language: Optional[str] = None)
             "Maza mulga, maza mulgi, shikshan, shala, mahiti pahije."
         )
 
+        client = get_groq_client()
         with open(audio_file_path, "rb") as file:
             # Groq is 100x faster than local CPU transcription
             transcription = await asyncio.to_thread(
@@ -91,6 +109,8 @@ async def text_to_speech(text: str, lang: str = "hi") -> Optional[str]:
         URL path to the generated audio file.
     """
     try:
+        import edge_tts
+
         # Map language codes to natural-sounding regional voices
         voice_map = {
             "hi": "hi-IN-MadhurNeural",   # Hindi (India) - Male
@@ -0,0 +1,113 @@
+"""
+Startup-time profile for the SETU backend.
+
+Imports `app.py` in a fresh interpreter with `python -X importtime`, prints
+the slowest imports (cumulative time), and fails if:
+- a heavy dependency is imported eagerly at startup, or
+- total import time of `app` exceeds the budget.
+
+Usage (from backend/):
+    python benchmarks/startup_profile.py
+    python benchmarks/startup_profile.py --top 30 --max-seconds 2.5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# These must only be imported on first use (or during warm-up)
+LAZY_MODULES = [
+    "google.genai",
+    "groq",
+    "edge_tts",
+    "pdfplumber",
+    "faiss",
+    "sentence_transformers",
+    "torch",
+]
+
+DEFAULT_MAX_SECONDS = 3.0
+
+PROBE = (
+    "import json, sys\n"
+    "import app\n"
+    f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))\n"
+)
+
+
+def run_import_profile() -> Tuple[List[Tuple[str, int, int]], List[str]]:
+    """
+    Import `app` in a subprocess with -X importtime.
+
+    Returns:
+        (rows, eagerly_loaded) where rows are (module, self_us, cumulative_us)
+        and eagerly_loaded lists LAZY_MODULES found in sys.modules.
+    """
+    env = dict(os.environ, SETU_WARMUP_ON_STARTUP="0")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    rows = []
+    other_stderr = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other_stderr.append(line)
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+
+    if result.returncode != 0:
+        print("\n".join(other_stderr), file=sys.stderr)
+        raise RuntimeError(f"Importing app failed (exit code {result.returncode})")
+
+    eagerly_loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return rows, eagerly_loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile SETU backend import time")
+    parser.add_argument("--top", type=int, default=20, help="Number of slowest imports to show")
+    parser.add_argument("--max-seconds", type=float, default=DEFAULT_MAX_SECONDS,
+                        help="Fail if importing app takes longer than this")
+    args = parser.parse_args()
+
+    rows, eagerly_loaded = run_import_profile()
+
+    app_row = next((row for row in rows if row[0] == "app"), None)
+    total_seconds = app_row[2] / 1_000_000 if app_row else 0.0
+
+    print(f"[STARTUP] Slowest {args.top} imports (cumulative):")
+    print(f"{'cumulative ms':>14} {'self ms':>10}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>10.1f}  {name}")
+
+    print(f"\n[STARTUP] import app: {total_seconds:.3f}s (budget {args.max_seconds:.1f}s)")
+
+    failed = False
+    if eagerly_loaded:
+        print(f"[STARTUP] FAIL: heavy modules imported at startup: {', '.join(eagerly_loaded)}")
+        failed = True
+    if total_seconds > args.max_seconds:
+        print("[STARTUP] FAIL: import time over budget")
+        failed = True
+
+    if not failed:
+        print("[STARTUP] OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,9 @@
 pdf_reader.py
 
 Extracts raw text from PDF files using pdfplumber.
+pdfplumber is imported lazily to keep app startup fast.
 """
 
-import pdfplumber
-
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
@@ -18,6 +17,8 @@ def extract_text_from_pdf(pdf_path: str) -> str:
         Extracted text as a single string.
         Returns empty string if extraction fails.
     """
+    import pdfplumber
+
     text_parts = []
 
     try:
@@ -31,3 +32,8 @@ def extract_text_from_pdf(pdf_path: str) -> str:
 
     return "\n".join(text_parts)
 
+
+def warm_up() -> None:
+    """Import pdfplumber ahead of the first PDF upload."""
+    import pdfplumber  # noqa: F401
+
@@ -1,10 +1,21 @@
-from google import genai
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Gemini client auto-loads GEMINI_API_KEY from .env
-client = genai.Client()
+
+@lru_cache(maxsize=1)
+def get_gemini_client():
+    # Imported here: google.genai is slow to import and only needed per request.
+    # Gemini client auto-loads GEMINI_API_KEY from .env
+    from google import genai
+
+    return genai.Client()
+
+
+def warm_up() -> None:
+    get_gemini_client()
 
 
 def answer_from_notice(notice_text: str, question: str) -> str:
@@ -28,7 +39,7 @@ Rules:
 Answer:
 """
 
-    response = client.models.generate_content(
+    response = get_gemini_client().models.generate_content(
         model="gemini-2.5-flash",
         contents=prompt
     )
@@ -5,14 +5,41 @@ Robust RAG utilities for hackathon demo.
 - Uses sentence-transformers for embeddings
 - Uses FAISS for retrieval
 - Works even when backend is inside venv
+- faiss and sentence-transformers (torch) are imported on first use
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
-import numpy as np
-import faiss
-from sentence_transformers import SentenceTransformer
+if TYPE_CHECKING:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+# -------------------------------
+# LAZY MODEL LOADING
+# -------------------------------
+@lru_cache(maxsize=1)
+def _get_embedding_model() -> "SentenceTransformer":
+    """
+    Load the embedding model once, on first use.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    print(f"[RAG] Loading embedding model: {EMBEDDING_MODEL_NAME}")
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+
+def warm_up() -> None:
+    """
+    Import faiss and load the embedding model ahead of the first query.
+    """
+    import faiss  # noqa: F401
+
+    _get_embedding_model()
 
 
 # -------------------------------
@@ -74,7 +101,9 @@ def _chunk_text(text: str, max_words: int = 200) -> List[str]:
 # -------------------------------
 # BUILD KNOWLEDGE BASE
 # -------------------------------
-def build_knowledge_base() -> Tuple[faiss.IndexFlatL2, List[str]]:
+def build_knowledge_base() -> Tuple["faiss.IndexFlatL2", List[str]]:
+    import faiss
+
     kb_dir = _find_knowledge_base_dir()
     print(f"[RAG] Knowledge base directory: {kb_dir}")
 
@@ -87,7 +116,7 @@ def build_knowledge_base() -> Tuple[faiss.IndexFlatL2, List[str]]:
 
     print(f"[RAG] Created {len(chunk_texts)} chunks")
 
-    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    model = _get_embedding_model()
     dim = model.get_sentence_embedding_dimension()
 
     index = faiss.IndexFlatL2(dim)
@@ -110,14 +139,14 @@ def build_knowledge_base() -> Tuple[faiss.IndexFlatL2, List[str]]:
 # -------------------------------
 def retrieve_context(
     query: str,
-    faiss_index: faiss.IndexFlatL2,
+    faiss_index: "faiss.IndexFlatL2",
     chunk_texts: List[str],
     top_k: int = 3
 ) -> str:
     if not chunk_texts:
         return ""
 
-    model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    model = _get_embedding_model()
 
     query_embedding = model.encode(
         [query],